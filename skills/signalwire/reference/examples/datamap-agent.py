@@ -17,8 +17,49 @@ Test with: swaig-test datamap-agent.py --dump-swml
 from signalwire_agents import AgentBase
 from signalwire_agents.core.function_result import SwaigFunctionResult
 from signalwire_agents.core.data_map import DataMap
+from functools import lru_cache
+import ast
+import operator
 import os
 
+# Deletion table for the calculator: translating an expression through it
+# strips every allowed character, so anything left over is disallowed.
+_CALC_ALLOWED = str.maketrans("", "", "0123456789+-*/.() ")
+
+
+_CALC_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+def _eval_node(node):
+    """Evaluate a parsed expression built only from numbers and + - * / //."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _CALC_OPERATORS:
+        return _CALC_OPERATORS[type(node.op)](_eval_node(node.left), _eval_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _CALC_OPERATORS:
+        return _CALC_OPERATORS[type(node.op)](_eval_node(node.operand))
+    raise ValueError("Unsupported expression")
+
+
+@lru_cache(maxsize=256)
+def _calculate(expression):
+    """Evaluate a validated math expression, reusing results for repeat questions."""
+    return _eval_node(ast.parse(expression, mode="eval").body)
+
+
+_END_CALL_RESULT = SwaigFunctionResult(
+    "Thanks for chatting! Have a great day. Goodbye!",
+    post_process=True
+).add_action("hangup", {})
+
 
 class DataMapAgent(AgentBase):
     """Agent demonstrating DataMap for server-side API calls."""
@@ -135,16 +176,17 @@ class DataMapAgent(AgentBase):
         expression = args.get("expression", "")
 
         # Only allow safe characters
-        allowed = set("0123456789+-*/.() ")
-        if not all(c in allowed for c in expression):
+        if expression.translate(_CALC_ALLOWED):
             return SwaigFunctionResult(
                 "I can only do basic math with numbers and operators. "
                 "Try something like '10 plus 5' or '100 divided by 4'."
             )
 
+        # Parsing rejects leading whitespace that eval() on a string used to skip
+        expression = expression.strip()
+
         try:
-            # Evaluate safely
-            result = eval(expression, {"__builtins__": {}}, {})
+            result = _calculate(expression)
             return SwaigFunctionResult(
                 f"The result of {expression} is {result}."
             )
@@ -160,10 +202,7 @@ class DataMapAgent(AgentBase):
     )
     def end_call(self, args, raw_data):
         """End the call."""
-        return SwaigFunctionResult(
-            "Thanks for chatting! Have a great day. Goodbye!",
-            post_process=True
-        ).add_action("hangup", {})
+        return _END_CALL_RESULT
 
 
 if __name__ == "__main__":
@@ -53,6 +53,79 @@ FAQS = {
     }
 }
 
+# Prompt sections as (title, body, bullets), built once at import
+_PROMPT_SECTIONS = (
+    (
+        "Role",
+        "You are a friendly FAQ assistant for Acme Corp. "
+        "You help customers with common questions about our products and services.",
+        ()
+    ),
+    (
+        "Guidelines",
+        "Follow these guidelines:",
+        (
+            "Answer questions using the FAQ lookup function when possible",
+            "Be friendly and conversational",
+            "Keep responses concise - this is a voice conversation",
+            "If you don't know the answer, offer to transfer to a human",
+            "Use the datetime skill to tell users the current time or date",
+            "Use web_search for questions not in the FAQ (if available)"
+        )
+    ),
+    (
+        "Available Topics",
+        "You can answer questions about:",
+        (
+            "Business hours",
+            "Return policy",
+            "Shipping times and costs",
+            "Payment methods",
+            "Product warranty",
+            "Contact information"
+        )
+    ),
+)
+
+# Tool responses are built once from the knowledge base. They carry no
+# actions and handlers never modify them, so every call can share them.
+_FAQ_RESULTS = {
+    topic: SwaigFunctionResult(faq["answer"]) for topic, faq in FAQS.items()
+}
+
+_FAQ_FALLBACK_RESULT = SwaigFunctionResult(
+    "I don't have information about that topic. "
+    "Would you like me to transfer you to a customer service representative?"
+)
+
+_FAQ_TOPICS_RESULT = SwaigFunctionResult(
+    "I can help you with the following topics: "
+    + ". ".join(faq["question"] for faq in FAQS.values())
+    + ". What would you like to know about?"
+)
+
+
+def _transfer_result(reason):
+    """Reply that hands the caller to a human, recording why."""
+    return (SwaigFunctionResult(
+        "I'll connect you with a customer service representative now. "
+        "Please hold while I transfer you."
+    )
+    .add_actions([
+        {"set_global_data": {"transfer_reason": reason}},
+        {"transfer": {"dest": "sip:support@company.com"}}
+    ]))
+
+
+# Most transfers use the default reason, so that reply is built once
+_DEFAULT_TRANSFER_RESULT = _transfer_result("Customer requested assistance")
+
+
+_END_CALL_RESULT = SwaigFunctionResult(
+    "Thank you for calling Acme Corp! Have a great day. Goodbye!",
+    post_process=True
+).add_action("hangup", {})
+
 
 class FAQBot(AgentBase):
     """FAQ bot with knowledge base and skill integration."""
@@ -71,7 +144,8 @@ class FAQBot(AgentBase):
             ]
         )
 
-        # Add built-in skills
+        # Add built-in skills. add_skill() imports and sets up each skill
+        # here, at startup, so the first caller doesn't pay that cost.
         self.add_skill("datetime", {"timezone": "America/New_York"})
 
         # Optionally add web search if API keys available
@@ -82,37 +156,8 @@ class FAQBot(AgentBase):
             })
 
         # Build the prompt
-        self.prompt_add_section(
-            "Role",
-            "You are a friendly FAQ assistant for Acme Corp. "
-            "You help customers with common questions about our products and services."
-        )
-
-        self.prompt_add_section(
-            "Guidelines",
-            body="Follow these guidelines:",
-            bullets=[
-                "Answer questions using the FAQ lookup function when possible",
-                "Be friendly and conversational",
-                "Keep responses concise - this is a voice conversation",
-                "If you don't know the answer, offer to transfer to a human",
-                "Use the datetime skill to tell users the current time or date",
-                "Use web_search for questions not in the FAQ (if available)"
-            ]
-        )
-
-        self.prompt_add_section(
-            "Available Topics",
-            body="You can answer questions about:",
-            bullets=[
-                "Business hours",
-                "Return policy",
-                "Shipping times and costs",
-                "Payment methods",
-                "Product warranty",
-                "Contact information"
-            ]
-        )
+        for title, body, bullets in _PROMPT_SECTIONS:
+            self.prompt_add_section(title, body, bullets=list(bullets))
 
         # Configure AI behavior
         self.set_params({
@@ -134,22 +179,18 @@ class FAQBot(AgentBase):
             "topic": {
                 "type": "string",
                 "description": "The FAQ topic to look up",
-                "enum": ["hours", "returns", "shipping", "payment", "warranty", "contact"]
+                "enum": list(FAQS)
             }
         }
     )
     def lookup_faq(self, args, raw_data):
         """Look up FAQ answer by topic."""
-        topic = args.get("topic", "").lower()
-
-        faq = FAQS.get(topic)
-        if faq:
-            return SwaigFunctionResult(faq["answer"])
-        else:
-            return SwaigFunctionResult(
-                "I don't have information about that topic. "
-                "Would you like me to transfer you to a customer service representative?"
-            )
+        # The SDK only warns when topic is outside the enum, so fold case
+        # here; anything else falls through to the fallback reply.
+        topic = args.get("topic")
+        if not isinstance(topic, str):
+            return _FAQ_FALLBACK_RESULT
+        return _FAQ_RESULTS.get(topic.lower(), _FAQ_FALLBACK_RESULT)
 
     @AgentBase.tool(
         name="list_faq_topics",
@@ -158,13 +199,7 @@ class FAQBot(AgentBase):
     )
     def list_faq_topics(self, args, raw_data):
         """List all FAQ topics."""
-        topics = [faq["question"] for faq in FAQS.values()]
-        topic_list = ". ".join(topics)
-
-        return SwaigFunctionResult(
-            f"I can help you with the following topics: {topic_list}. "
-            "What would you like to know about?"
-        )
+        return _FAQ_TOPICS_RESULT
 
     @AgentBase.tool(
         name="transfer_to_human",
@@ -179,14 +214,9 @@ class FAQBot(AgentBase):
     )
     def transfer_to_human(self, args, raw_data):
         """Transfer to human support."""
-        reason = args.get("reason", "Customer requested assistance")
-
-        return (SwaigFunctionResult(
-            "I'll connect you with a customer service representative now. "
-            "Please hold while I transfer you."
-        )
-        .add_action("set_global_data", {"transfer_reason": reason})
-        .add_action("transfer", {"dest": "sip:support@company.com"}))
+        if "reason" not in args:
+            return _DEFAULT_TRANSFER_RESULT
+        return _transfer_result(args["reason"])
 
     @AgentBase.tool(
         name="end_call",
@@ -195,10 +225,7 @@ class FAQBot(AgentBase):
     )
     def end_call(self, args, raw_data):
         """Politely end the call."""
-        return SwaigFunctionResult(
-            "Thank you for calling Acme Corp! Have a great day. Goodbye!",
-            post_process=True
-        ).add_action("hangup", {})
+        return _END_CALL_RESULT
 
 
 if __name__ == "__main__":
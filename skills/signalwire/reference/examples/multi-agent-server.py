@@ -11,43 +11,104 @@ Test with: swaig-test multi-agent-server.py --agent-class SupportAgent --dump-sw
 
 from signalwire_agents import AgentBase, AgentServer
 from signalwire_agents.core.function_result import SwaigFunctionResult
+from dataclasses import dataclass
 from pathlib import Path
 import os
 
 HOST = os.getenv("HOST", "0.0.0.0")
 PORT = int(os.getenv("PORT", "3000"))
 
+_LANGUAGE = ("English", "en-US", "rime.spore")
+
+# Let browsers reuse web UI files for an hour instead of refetching them
+_STATIC_CACHE_CONTROL = "public, max-age=3600"
+
+
+@dataclass(frozen=True, slots=True)
+class AgentSpec:
+    """Static voice, prompt and AI settings shared by every instance of an agent."""
+
+    role: str
+    bullets: tuple[str, ...]
+    params: tuple[tuple[str, int], ...]
+    language: tuple[str, str, str] = _LANGUAGE
+
+
+def _apply_spec(agent, spec):
+    """Configure an agent's voice, prompt and AI behavior from its spec."""
+    agent.add_language(*spec.language)
+    agent.prompt_add_section("Role", spec.role)
+    agent.prompt_add_section("Guidelines", bullets=list(spec.bullets))
+    agent.set_params(dict(spec.params))
+
+
+def _escalation_result(reason):
+    """Reply that escalates to a human support agent."""
+    return (SwaigFunctionResult(
+        "I'll connect you with a support specialist who can help further. "
+        "Please hold while I transfer you."
+    )
+    .add_actions([
+        {"set_global_data": {"escalation_reason": reason}},
+        {"transfer": {"dest": "sip:support@company.com"}}
+    ]))
+
+
+# Escalations without a stated reason share one prebuilt reply
+_DEFAULT_ESCALATION_RESULT = _escalation_result("Customer requested transfer")
+
+
+_SUPPORT_SPEC = AgentSpec(
+    role="You are a friendly customer support agent for Acme Corp.",
+    bullets=(
+        "Help customers resolve issues",
+        "Escalate complex problems to human agents",
+        "Always be polite and professional",
+        "Use lookup_order to check order status",
+        "Use escalate to transfer to a human"
+    ),
+    params=(
+        ("end_of_speech_timeout", 1000),
+        ("attention_timeout", 15000)
+    )
+)
+
+_SALES_SPEC = AgentSpec(
+    role="You are an enthusiastic sales representative for Acme Corp.",
+    bullets=(
+        "Help customers find the right products",
+        "Answer questions about pricing and features",
+        "Use get_product_info to look up product details",
+        "Be enthusiastic but not pushy"
+    ),
+    params=(
+        ("end_of_speech_timeout", 1500),
+        ("attention_timeout", 20000)
+    )
+)
+
+_BILLING_SPEC = AgentSpec(
+    role="You are a billing specialist for Acme Corp.",
+    bullets=(
+        "Help customers with billing questions",
+        "Use get_balance to check account balance",
+        "Use process_payment to take payments",
+        "Always verify customer identity before discussing account details"
+    ),
+    # Stricter timeout for billing
+    params=(
+        ("end_of_speech_timeout", 800),
+        ("inactivity_timeout", 180000)  # 3 minutes
+    )
+)
+
 
 class SupportAgent(AgentBase):
     """Handles customer support inquiries."""
 
     def __init__(self):
         super().__init__(name="support-agent")
-
-        # Voice configuration
-        self.add_language("English", "en-US", "rime.spore")
-
-        # Prompt
-        self.prompt_add_section(
-            "Role",
-            "You are a friendly customer support agent for Acme Corp."
-        )
-        self.prompt_add_section(
-            "Guidelines",
-            bullets=[
-                "Help customers resolve issues",
-                "Escalate complex problems to human agents",
-                "Always be polite and professional",
-                "Use lookup_order to check order status",
-                "Use escalate to transfer to a human"
-            ]
-        )
-
-        # AI behavior
-        self.set_params({
-            "end_of_speech_timeout": 1000,
-            "attention_timeout": 15000
-        })
+        _apply_spec(self, _SUPPORT_SPEC)
 
     @AgentBase.tool(
         name="lookup_order",
@@ -79,13 +140,9 @@ class SupportAgent(AgentBase):
         }
     )
     def escalate(self, args, raw_data):
-        reason = args.get("reason", "Customer requested transfer")
-        return (SwaigFunctionResult(
-            "I'll connect you with a support specialist who can help further. "
-            "Please hold while I transfer you."
-        )
-        .add_action("set_global_data", {"escalation_reason": reason})
-        .add_action("transfer", {"dest": "sip:support@company.com"}))
+        if "reason" not in args:
+            return _DEFAULT_ESCALATION_RESULT
+        return _escalation_result(args["reason"])
 
 
 class SalesAgent(AgentBase):
@@ -93,27 +150,7 @@ class SalesAgent(AgentBase):
 
     def __init__(self):
         super().__init__(name="sales-agent")
-
-        self.add_language("English", "en-US", "rime.spore")
-
-        self.prompt_add_section(
-            "Role",
-            "You are an enthusiastic sales representative for Acme Corp."
-        )
-        self.prompt_add_section(
-            "Guidelines",
-            bullets=[
-                "Help customers find the right products",
-                "Answer questions about pricing and features",
-                "Use get_product_info to look up product details",
-                "Be enthusiastic but not pushy"
-            ]
-        )
-
-        self.set_params({
-            "end_of_speech_timeout": 1500,
-            "attention_timeout": 20000
-        })
+        _apply_spec(self, _SALES_SPEC)
 
     @AgentBase.tool(
         name="get_product_info",
@@ -164,28 +201,7 @@ class BillingAgent(AgentBase):
 
     def __init__(self):
         super().__init__(name="billing-agent")
-
-        self.add_language("English", "en-US", "rime.spore")
-
-        self.prompt_add_section(
-            "Role",
-            "You are a billing specialist for Acme Corp."
-        )
-        self.prompt_add_section(
-            "Guidelines",
-            bullets=[
-                "Help customers with billing questions",
-                "Use get_balance to check account balance",
-                "Use process_payment to take payments",
-                "Always verify customer identity before discussing account details"
-            ]
-        )
-
-        # Stricter timeout for billing
-        self.set_params({
-            "end_of_speech_timeout": 800,
-            "inactivity_timeout": 180000  # 3 minutes
-        })
+        _apply_spec(self, _BILLING_SPEC)
 
     @AgentBase.tool(
         name="get_balance",
@@ -223,44 +239,63 @@ class BillingAgent(AgentBase):
         }
     )
     def process_payment(self, args, raw_data):
-        amount = args.get("amount", 0)
+        amount = f"${args.get('amount', 0):.2f}"
         confirmed = args.get("confirm", False)
 
         if not confirmed:
             return SwaigFunctionResult(
-                f"I can process a payment of ${amount:.2f}. "
+                f"I can process a payment of {amount}. "
                 "This will be charged to your card on file ending in 4242. "
                 "Do you confirm this payment?"
             )
 
         return (SwaigFunctionResult(
-            f"Payment of ${amount:.2f} has been processed successfully. "
+            f"Payment of {amount} has been processed successfully. "
             "You'll receive a confirmation email shortly. "
             "Is there anything else I can help you with?"
         )
         .add_action("send_sms", {
             "to": raw_data.get("call", {}).get("from"),
-            "body": f"Acme Corp: Payment of ${amount:.2f} confirmed. Thank you!"
+            "body": f"Acme Corp: Payment of {amount} confirmed. Thank you!"
         }))
 
 
+# Agents hosted by this server, as (label, route, agent class)
+_AGENTS = (
+    ("Support agent", "/support", SupportAgent),
+    ("Sales agent", "/sales", SalesAgent),
+    ("Billing agent", "/billing", BillingAgent),
+)
+
+
+def _cache_static_files(server):
+    """Add Cache-Control to files returned by serve_static_files()."""
+    @server.app.middleware("http")
+    async def add_cache_control(request, call_next):
+        response = await call_next(request)
+        # Static files are sent as FileResponse, the only response here
+        # that carries Last-Modified
+        if "last-modified" in response.headers:
+            response.headers.setdefault("Cache-Control", _STATIC_CACHE_CONTROL)
+        return response
+
+
 if __name__ == "__main__":
     # Create server
     server = AgentServer(host=HOST, port=PORT)
 
     # Register all agents
-    server.register(SupportAgent(), "/support")
-    server.register(SalesAgent(), "/sales")
-    server.register(BillingAgent(), "/billing")
+    for _, route, agent_class in _AGENTS:
+        server.register(agent_class(), route)
 
     # Optionally serve static files
     web_dir = Path(__file__).parent / "web"
     if web_dir.exists():
         server.serve_static_files(str(web_dir))
+        _cache_static_files(server)
         print(f"Web UI: http://{HOST}:{PORT}/")
 
-    print(f"Support agent: http://{HOST}:{PORT}/support")
-    print(f"Sales agent: http://{HOST}:{PORT}/sales")
-    print(f"Billing agent: http://{HOST}:{PORT}/billing")
+    for label, route, _ in _AGENTS:
+        print(f"{label}: http://{HOST}:{PORT}{route}")
 
     server.run()
@@ -7,6 +7,9 @@ platforms with SWAIG functions.
 Environment variables:
     SWML_BASIC_AUTH_USER: Basic auth username (optional)
     SWML_BASIC_AUTH_PASSWORD: Basic auth password (optional)
+    MAX_INFLIGHT_TOOLS: Concurrent tool calls per instance before callers
+        are told to retry (optional, default 16; invalid values fall back to
+        16 and values below 1 are raised to 1)
 
 AWS Lambda requirements.txt:
     signalwire-agents>=1.0.10
@@ -24,10 +27,77 @@ Azure Functions requirements.txt:
     signalwire-agents>=1.0.10
 """
 
+import functools
 import os
+import threading
 from signalwire_agents import AgentBase, SwaigFunctionResult
 
 
+def _max_inflight_tools():
+    """Read MAX_INFLIGHT_TOOLS without letting a bad value fail the import."""
+    try:
+        return max(1, int(os.getenv("MAX_INFLIGHT_TOOLS", "16")))
+    except ValueError:
+        return 16
+
+
+# Platforms that serve several requests per instance (Cloud Functions gen2,
+# Azure) share one process, so cap concurrent downstream work. Callers that
+# cannot get a slot quickly are asked to retry instead of piling up on the
+# database connection pool.
+_TOOL_SLOTS = threading.BoundedSemaphore(_max_inflight_tools())
+_TOOL_SLOT_WAIT = 0.5  # seconds
+
+
+def _bounded(handler):
+    """Run a tool handler only when an in-flight slot is free."""
+    @functools.wraps(handler)
+    def wrapper(args, raw_data):
+        if not _TOOL_SLOTS.acquire(timeout=_TOOL_SLOT_WAIT):
+            return SwaigFunctionResult(
+                "Our system is busy right now. Please ask me again in a moment."
+            )
+        try:
+            return handler(args, raw_data)
+        finally:
+            _TOOL_SLOTS.release()
+    return wrapper
+
+
+def _detect_runtime():
+    """Describe which serverless platform this container is running on."""
+    if os.getenv("AWS_LAMBDA_FUNCTION_NAME"):
+        platform = "AWS Lambda"
+        details = f"Function: {os.getenv('AWS_LAMBDA_FUNCTION_NAME')}, Region: {os.getenv('AWS_REGION')}"
+    elif os.getenv("K_SERVICE"):
+        platform = "Google Cloud Functions"
+        details = f"Service: {os.getenv('K_SERVICE')}, Revision: {os.getenv('K_REVISION')}"
+    elif os.getenv("FUNCTIONS_WORKER_RUNTIME"):
+        platform = "Azure Functions"
+        details = f"App: {os.getenv('WEBSITE_SITE_NAME')}, Region: {os.getenv('REGION_NAME')}"
+    else:
+        platform = "Local/Unknown"
+        details = "Running locally or in unknown environment"
+
+    return f"Running on {platform}. {details}"
+
+
+def _transfer_result(reason):
+    """Reply that transfers the caller to human support."""
+    return (
+        SwaigFunctionResult(f"Transferring you to a specialist for: {reason}")
+        .add_action("transfer", {"dest": "sip:support@example.com"})
+    )
+
+
+# The default reason is the common case; reuse one reply for it
+_DEFAULT_TRANSFER_RESULT = _transfer_result("customer request")
+
+
+# The platform cannot change for the life of a container, so detect it once
+_RUNTIME_INFO_RESULT = SwaigFunctionResult(_detect_runtime())
+
+
 class CustomerServiceAgent(AgentBase):
     """Customer service agent for serverless deployment."""
 
@@ -72,6 +142,7 @@ class CustomerServiceAgent(AgentBase):
             },
             fillers=["Let me check that order for you", "One moment please"]
         )
+        @_bounded
         def lookup_order(args, raw_data):
             order_num = args.get("order_number", "")
             # In production, query your database here
@@ -93,33 +164,28 @@ class CustomerServiceAgent(AgentBase):
             }
         )
         def transfer_to_support(args, raw_data):
-            reason = args.get("reason", "customer request")
-            return (
-                SwaigFunctionResult(f"Transferring you to a specialist for: {reason}")
-                .add_action("transfer", {"dest": "sip:support@example.com"})
-            )
+            if "reason" not in args:
+                return _DEFAULT_TRANSFER_RESULT
+            return _transfer_result(args["reason"])
 
         @self.tool(description="Get the current platform runtime information")
         def get_runtime_info(args, raw_data):
-            # Detect which platform we're running on
-            if os.getenv("AWS_LAMBDA_FUNCTION_NAME"):
-                platform = "AWS Lambda"
-                details = f"Function: {os.getenv('AWS_LAMBDA_FUNCTION_NAME')}, Region: {os.getenv('AWS_REGION')}"
-            elif os.getenv("K_SERVICE"):
-                platform = "Google Cloud Functions"
-                details = f"Service: {os.getenv('K_SERVICE')}, Revision: {os.getenv('K_REVISION')}"
-            elif os.getenv("FUNCTIONS_WORKER_RUNTIME"):
-                platform = "Azure Functions"
-                details = f"App: {os.getenv('WEBSITE_SITE_NAME')}, Region: {os.getenv('REGION_NAME')}"
-            else:
-                platform = "Local/Unknown"
-                details = "Running locally or in unknown environment"
-
-            return SwaigFunctionResult(f"Running on {platform}. {details}")
+            return _RUNTIME_INFO_RESULT
+
+
+def _is_warmup_event(event):
+    """Return True for scheduled keep-warm pings that need no agent work."""
+    return isinstance(event, dict) and (
+        event.get("source") == "aws.events" or event.get("warmer") is True
+    )
 
 
 # CRITICAL: Create agent instance OUTSIDE handler for cold start optimization
-# This ensures the agent is only initialized once per container instance
+# This ensures the agent is only initialized once per container instance.
+# On Lambda and Cloud Functions, run() handles events directly (there is no
+# FastAPI app or startup hook), so the platform's init phase is the cheapest
+# place for prompt, tool and skill setup - deferring it would move that work
+# onto the first caller's request.
 agent = CustomerServiceAgent()
 
 
@@ -133,6 +199,9 @@ def lambda_handler(event, context):
     - Routes: GET /, POST /, POST /swaig, ANY /{proxy+}
     - Integration: Lambda proxy (AWS_PROXY)
 
+    Scheduled EventBridge pings (or a {"warmer": true} payload) return
+    immediately so keeping the container warm costs almost nothing.
+
     Args:
         event: API Gateway event
         context: Lambda context
@@ -140,6 +209,8 @@ def lambda_handler(event, context):
     Returns:
         API Gateway response dict
     """
+    if _is_warmup_event(event):
+        return {"statusCode": 200, "body": "warm"}
     return agent.run(event, context)
 
 
@@ -157,12 +228,16 @@ def main(request):
             --allow-unauthenticated \
             --entry-point main
 
+    Scheduler pings sent with an "X-Warmer: 1" header return immediately.
+
     Args:
         request: Flask request object
 
     Returns:
         Flask response
     """
+    if request.headers.get("X-Warmer") == "1":
+        return "warm", 200
     return agent.run(request)
 
 
@@ -198,4 +273,6 @@ def main(request):
 #     Returns:
 #         Azure HTTP response
 #     """
+#     if req.headers.get("X-Warmer") == "1":
+#         return func.HttpResponse("warm")
 #     return agent.run(req)
@@ -14,6 +14,9 @@ Test with: swaig-test simple-agent.py --dump-swml
 
 from signalwire_agents import AgentBase
 from signalwire_agents.core.function_result import SwaigFunctionResult
+from datetime import datetime
+
+_TIME_FORMAT = "%I:%M %p on %A, %B %d, %Y"
 
 
 class SimpleAgent(AgentBase):
@@ -59,12 +62,8 @@ class SimpleAgent(AgentBase):
     )
     def get_time(self, args, raw_data):
         """Return the current date and time."""
-        from datetime import datetime
-
-        now = datetime.now()
         return SwaigFunctionResult(
-            f"The current time is {now.strftime('%I:%M %p')} "
-            f"on {now.strftime('%A, %B %d, %Y')}."
+            f"The current time is {datetime.now().strftime(_TIME_FORMAT)}."
         )
 
 
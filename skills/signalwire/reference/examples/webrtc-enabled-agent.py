@@ -15,11 +15,64 @@ Run with: python webrtc-enabled-agent.py
 
 from signalwire_agents import AgentBase, AgentServer
 from signalwire_agents.core.function_result import SwaigFunctionResult
+from fastapi import Request, Response
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from string import Template
+import gzip
+import hashlib
 import os
+import time
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Environment settings for the agent."""
+
+    basic_auth: tuple[str, str] | None
+    debug_url: str | None
+    debug_level: int | None
+
+
+def _load_config():
+    """Read the agent's environment settings in one pass."""
+    auth_user = os.getenv("SWML_BASIC_AUTH_USER")
+    auth_password = os.getenv("SWML_BASIC_AUTH_PASSWORD")
+    debug_url = os.getenv("DEBUG_WEBHOOK_URL")
+    debug_level = None
+    if debug_url:
+        # A bad level must not make importing this module fail
+        try:
+            debug_level = int(os.getenv("DEBUG_WEBHOOK_LEVEL", "1"))
+        except ValueError:
+            debug_level = 1
+    return Config(
+        # Optional: require authentication, only when both halves are set
+        basic_auth=(auth_user, auth_password) if auth_user and auth_password else None,
+        debug_url=debug_url,
+        debug_level=debug_level
+    )
+
+
+# Environment is read once at import and reused by every agent instance
+_CFG = _load_config()
+
+# Spoken time, e.g. "03:45 PM on Monday, October 12, 2026"
+_TIME_FORMAT = "%I:%M %p on %A, %B %d, %Y"
+
+
+@lru_cache(maxsize=1)
+def _format_minute(minute):
+    """Render the spoken time for a Unix minute; calls in the same minute reuse it."""
+    return datetime.fromtimestamp(minute * 60).strftime(_TIME_FORMAT)
 
-HOST = os.getenv("HOST", "0.0.0.0")
-PORT = int(os.getenv("PORT", "3000"))
+
+_END_CALL_RESULT = SwaigFunctionResult(
+    "Thanks for chatting! Have a great day. Goodbye!",
+    post_process=True  # Let AI finish speaking before hangup
+).add_action("hangup", {})
 
 
 class WebRTCAgent(AgentBase):
@@ -28,11 +81,7 @@ class WebRTCAgent(AgentBase):
     def __init__(self):
         super().__init__(
             name="webrtc-agent",
-            # Optional: require authentication
-            basic_auth=(
-                os.getenv("SWML_BASIC_AUTH_USER"),
-                os.getenv("SWML_BASIC_AUTH_PASSWORD")
-            ) if os.getenv("SWML_BASIC_AUTH_USER") else None
+            basic_auth=_CFG.basic_auth
         )
 
         # Voice configuration
@@ -59,19 +108,19 @@ class WebRTCAgent(AgentBase):
         )
 
         # AI behavior tuned for WebRTC
-        self.set_params({
+        params = {
             "end_of_speech_timeout": 1200,  # Slightly longer for browser latency
             "attention_timeout": 30000,      # 30 seconds before "are you there?"
             "inactivity_timeout": 300000     # 5 minutes max
-        })
+        }
+
+        # Debug webhook if configured. SignalWire posts the debug events to
+        # this URL; the agent itself makes no outbound requests for it.
+        if _CFG.debug_url:
+            params["debug_webhook_url"] = _CFG.debug_url
+            params["debug_webhook_level"] = _CFG.debug_level
 
-        # Debug webhook if configured
-        debug_url = os.getenv("DEBUG_WEBHOOK_URL")
-        if debug_url:
-            self.set_params({
-                "debug_webhook_url": debug_url,
-                "debug_webhook_level": int(os.getenv("DEBUG_WEBHOOK_LEVEL", "1"))
-            })
+        self.set_params(params)
 
     @AgentBase.tool(
         name="get_time",
@@ -79,11 +128,8 @@ class WebRTCAgent(AgentBase):
         parameters={}
     )
     def get_time(self, args, raw_data):
-        from datetime import datetime
-        now = datetime.now()
         return SwaigFunctionResult(
-            f"The current time is {now.strftime('%I:%M %p')} "
-            f"on {now.strftime('%A, %B %d, %Y')}."
+            f"The current time is {_format_minute(int(time.time() // 60))}."
         )
 
     @AgentBase.tool(
@@ -92,52 +138,52 @@ class WebRTCAgent(AgentBase):
         parameters={}
     )
     def end_call(self, args, raw_data):
-        return SwaigFunctionResult(
-            "Thanks for chatting! Have a great day. Goodbye!",
-            post_process=True  # Let AI finish speaking before hangup
-        ).add_action("hangup", {})
+        return _END_CALL_RESULT
 
 
-def create_web_ui(web_dir: Path, guest_token: str, agent_address: str):
-    """Create a simple web UI for testing."""
-    web_dir.mkdir(exist_ok=True)
+# The page embeds the guest token, so only the browser may store it and it
+# must revalidate on every load; the ETag keeps that to a cheap 304
+_WEB_UI_CACHE_CONTROL = "private, no-cache"
 
-    html_content = f'''<!DOCTYPE html>
+# Web UI page; $guest_token and $agent_address are filled in by create_web_ui()
+_WEB_UI_TEMPLATE = Template('''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>AI Agent - WebRTC Demo</title>
+    <link rel="preconnect" href="https://cdn.signalwire.com">
+    <link rel="dns-prefetch" href="https://cdn.signalwire.com">
     <script src="https://cdn.signalwire.com/libs/swrtc/2.0.0/signalwire.min.js"></script>
     <style>
-        * {{ box-sizing: border-box; }}
-        body {{
+        * { box-sizing: border-box; }
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             max-width: 600px;
             margin: 50px auto;
             padding: 20px;
             background: #f5f5f5;
-        }}
-        .container {{
+        }
+        .container {
             background: white;
             border-radius: 12px;
             padding: 30px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        h1 {{
+        }
+        h1 {
             margin-top: 0;
             color: #333;
-        }}
-        .status {{
+        }
+        .status {
             padding: 10px 15px;
             border-radius: 6px;
             margin: 20px 0;
             font-weight: 500;
-        }}
-        .status.disconnected {{ background: #fee; color: #c00; }}
-        .status.connecting {{ background: #fef3cd; color: #856404; }}
-        .status.connected {{ background: #d4edda; color: #155724; }}
-        button {{
+        }
+        .status.disconnected { background: #fee; color: #c00; }
+        .status.connecting { background: #fef3cd; color: #856404; }
+        .status.connected { background: #d4edda; color: #155724; }
+        button {
             padding: 15px 30px;
             font-size: 16px;
             border: none;
@@ -145,37 +191,37 @@ def create_web_ui(web_dir: Path, guest_token: str, agent_address: str):
             cursor: pointer;
             margin-right: 10px;
             transition: all 0.2s;
-        }}
-        button:disabled {{
+        }
+        button:disabled {
             opacity: 0.5;
             cursor: not-allowed;
-        }}
-        #call-btn {{
+        }
+        #call-btn {
             background: #28a745;
             color: white;
-        }}
-        #call-btn:hover:not(:disabled) {{
+        }
+        #call-btn:hover:not(:disabled) {
             background: #218838;
-        }}
-        #hangup-btn {{
+        }
+        #hangup-btn {
             background: #dc3545;
             color: white;
-        }}
-        #hangup-btn:hover:not(:disabled) {{
+        }
+        #hangup-btn:hover:not(:disabled) {
             background: #c82333;
-        }}
-        .info {{
+        }
+        .info {
             margin-top: 20px;
             padding: 15px;
             background: #e9ecef;
             border-radius: 6px;
             font-size: 14px;
-        }}
-        .info code {{
+        }
+        .info code {
             background: #dee2e6;
             padding: 2px 6px;
             border-radius: 4px;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -193,14 +239,14 @@ def create_web_ui(web_dir: Path, guest_token: str, agent_address: str):
             <p><strong>How it works:</strong></p>
             <p>Click "Call Agent" to connect to the AI assistant via WebRTC.
             Speak naturally and the AI will respond in real-time.</p>
-            <p>Agent address: <code>{agent_address}</code></p>
+            <p>Agent address: <code>$agent_address</code></p>
         </div>
     </div>
 
     <script>
         // Configuration - replace with your values
-        const GUEST_TOKEN = '{guest_token}';
-        const AGENT_ADDRESS = '{agent_address}';
+        const GUEST_TOKEN = '$guest_token';
+        const AGENT_ADDRESS = '$agent_address';
 
         let client = null;
         let call = null;
@@ -209,81 +255,163 @@ def create_web_ui(web_dir: Path, guest_token: str, agent_address: str):
         const callBtn = document.getElementById('call-btn');
         const hangupBtn = document.getElementById('hangup-btn');
 
-        function setStatus(text, state) {{
+        function setStatus(text, state) {
             statusEl.textContent = 'Status: ' + text;
             statusEl.className = 'status ' + state;
-        }}
+        }
 
-        callBtn.onclick = async () => {{
-            try {{
+        callBtn.onclick = async () => {
+            try {
                 setStatus('Connecting...', 'connecting');
                 callBtn.disabled = true;
 
                 // Connect to SignalWire
-                client = await SignalWire.SignalWire({{
+                client = await SignalWire.SignalWire({
                     token: GUEST_TOKEN
-                }});
+                });
 
                 // Dial the agent
-                call = await client.dial({{
+                call = await client.dial({
                     to: AGENT_ADDRESS,
                     nodeId: null
-                }});
+                });
 
                 setStatus('Connected - speak now!', 'connected');
                 hangupBtn.disabled = false;
 
                 // Handle call ending
-                call.on('destroy', () => {{
+                call.on('destroy', () => {
                     setStatus('Call ended', 'disconnected');
                     callBtn.disabled = false;
                     hangupBtn.disabled = true;
                     call = null;
-                }});
+                });
 
-            }} catch (err) {{
+            } catch (err) {
                 console.error('Call failed:', err);
                 setStatus('Failed: ' + err.message, 'disconnected');
                 callBtn.disabled = false;
-            }}
-        }};
+            }
+        };
 
-        hangupBtn.onclick = () => {{
-            if (call) {{
+        hangupBtn.onclick = () => {
+            if (call) {
                 call.hangup();
-            }}
-        }};
+            }
+        };
     </script>
 </body>
-</html>'''
+</html>''')
+
+
+def create_web_ui(web_dir: Path, guest_token: str, agent_address: str) -> bytes:
+    """Create a simple web UI for testing and return the page as UTF-8 bytes."""
+    html_content = _WEB_UI_TEMPLATE.substitute(
+        guest_token=guest_token,
+        agent_address=agent_address
+    )
 
-    (web_dir / "index.html").write_text(html_content)
-    print(f"Created web UI at {web_dir / 'index.html'}")
+    payload = html_content.encode("utf-8")
+
+    # Warm restarts usually regenerate the same page; leave it alone then.
+    # The size check skips reading the file when it has clearly changed.
+    index_path = web_dir / "index.html"
+    try:
+        existing_size = index_path.stat().st_size
+    except FileNotFoundError:
+        web_dir.mkdir(exist_ok=True)
+    else:
+        if existing_size == len(payload) and index_path.read_bytes() == payload:
+            print(f"Web UI at {index_path} is up to date")
+            return payload
+
+    # serve_web_ui() answers / and /index.html from memory; the file is kept
+    # for other servers or tools that read web_dir. Write beside it and
+    # rename over it so those readers never see a partial page.
+    tmp_path = web_dir / ".index.html.tmp"
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, index_path)
+    print(f"Created web UI at {index_path}")
+    return payload
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip (q=0 means refused)."""
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        weight = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding.strip().lower()] = weight
+    # An explicit gzip entry overrides the * wildcard
+    return weights.get("gzip", weights.get("*", 0.0)) > 0
+
+
+def serve_web_ui(server: AgentServer, payload: bytes):
+    """Serve the web UI page from memory, gzip-compressed and with an ETag."""
+    payload_gz = gzip.compress(payload, compresslevel=6)
+    digest = hashlib.blake2b(payload, digest_size=8).hexdigest()
+    # Strong ETags must differ between content-codings of the same page
+    variants = {
+        False: (payload, f'"{digest}"'),
+        True: (payload_gz, f'"{digest}-gz"')
+    }
+
+    @server.app.get("/")
+    @server.app.get("/index.html")
+    async def web_ui(request: Request):
+        use_gzip = _accepts_gzip(request.headers.get("accept-encoding", ""))
+        body, etag = variants[use_gzip]
+        headers = {
+            "ETag": etag,
+            "Vary": "Accept-Encoding",
+            "Cache-Control": _WEB_UI_CACHE_CONTROL
+        }
+        if use_gzip:
+            headers["Content-Encoding"] = "gzip"
+        if_none_match = request.headers.get("if-none-match", "")
+        if if_none_match.strip() == "*" or etag in (
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        ):
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="text/html", headers=headers)
 
 
 if __name__ == "__main__":
-    # Check for required config
+    # Only the standalone server needs a listen address or the web UI
+    # settings, so importing this module (e.g. from a serverless handler)
+    # never reads them
+    host = os.getenv("HOST", "0.0.0.0")
+    port = int(os.getenv("PORT", "3000"))
     guest_token = os.getenv("SIGNALWIRE_GUEST_TOKEN", "YOUR_GUEST_TOKEN_HERE")
     agent_address = os.getenv("SIGNALWIRE_AGENT_ADDRESS", "/public/your-agent")
 
     # Create web UI
     web_dir = Path(__file__).parent / "web"
-    create_web_ui(web_dir, guest_token, agent_address)
+    page = create_web_ui(web_dir, guest_token, agent_address)
 
     # Create server
-    server = AgentServer(host=HOST, port=PORT)
+    server = AgentServer(host=host, port=port)
 
     # Register agent
     server.register(WebRTCAgent(), "/agent")
 
-    # Serve static files (web UI)
+    # Serve the web UI page from memory; any other files in web_dir
+    # are served from disk
+    serve_web_ui(server, page)
     server.serve_static_files(str(web_dir))
 
     print(f"\n{'='*50}")
     print("WebRTC Agent Running!")
     print(f"{'='*50}")
-    print(f"Agent endpoint: http://{HOST}:{PORT}/agent")
-    print(f"Web UI: http://{HOST}:{PORT}/")
+    print(f"Agent endpoint: http://{host}:{port}/agent")
+    print(f"Web UI: http://{host}:{port}/")
     print(f"\nTo use WebRTC:")
     print("1. Set SIGNALWIRE_GUEST_TOKEN from Fabric API")
     print("2. Set SIGNALWIRE_AGENT_ADDRESS (your agent's address)")